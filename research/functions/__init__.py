@@ -2,17 +2,23 @@
 
 from research.functions.download_helper import (
     DownloadStats,
+    append_price_data,
     cleanup_existing_files,
+    compact_price_files,
     create_new_file,
     determine_start_date,
     find_last_month_with_data,
     get_last_dates_per_ticker,
     get_month_path,
+    list_price_files,
     load_existing,
     merge_ticker_data_into_monthly_files,
+    migrate_csv_to_parquet,
     month_range,
     months_from,
     normalize_dates,
+    part_paths,
+    read_csv_table,
     save_price_data,
     update_existing_file,
 )
@@ -21,18 +27,24 @@ from research.functions.fetch_and_store import fetch_and_store
 
 __all__ = [
     "DownloadStats",
+    "append_price_data",
     "cleanup_existing_files",
+    "compact_price_files",
     "create_new_file",
     "determine_start_date",
     "fetch_and_store",
     "find_last_month_with_data",
     "get_last_dates_per_ticker",
     "get_month_path",
+    "list_price_files",
     "load_existing",
     "merge_ticker_data_into_monthly_files",
+    "migrate_csv_to_parquet",
     "month_range",
     "months_from",
     "normalize_dates",
+    "part_paths",
+    "read_csv_table",
     "save_price_data",
     "update_existing_file",
 ]
@@ -1,65 +1,221 @@
 """
-Worker for parallel cointegration tests. Used by ProcessPoolExecutor;
-initializer sets _wide so worker processes have the panel without per-task pickling.
+Engle-Granger cointegration tests over a wide panel (dates x tickers).
+
+screen_all_pairs runs the test for every pair of a wide panel in one
+process: the per-pair kernel is compiled with numba and the pairs are
+spread over threads, so no worker processes are needed.
+correlated_pairs pre-screens the pairs by correlation in one pass.
 """
-import warnings
+from functools import lru_cache
 
-from statsmodels.regression.linear_model import OLS
-from statsmodels.tools import add_constant
-from statsmodels.tsa.stattools import coint
-from statsmodels.tools.sm_exceptions import CollinearityWarning
+import numpy as np
+from numba import get_num_threads, njit, prange
+from statsmodels.tsa.adfvalues import mackinnoncrit, mackinnonp
 
 MIN_OBS = 100
-_wide = None
-
-
-def init_worker(wide_df):
-    global _wide
-    _wide = wide_df
-
-
-def test_pair(t1, t2):
-    """Run coint for one pair. Returns result dict or None if too few observations."""
-    s = _wide[[t1, t2]].dropna()
-    if len(s) < MIN_OBS:
-        return None
-    y0, y1 = s[t1].values, s[t2].values
-    with warnings.catch_warnings(record=True) as w:
-        warnings.simplefilter("always", CollinearityWarning)
-        try:
-            coint_t, pvalue, crit_values = coint(y0, y1, autolag=None, maxlag=0)
-            collinear = any(issubclass(x.category, CollinearityWarning) for x in w)
-            # Spread = residual from cointegrating regression (y0 on y1); std measures deviation from mean
-            ols_fit = OLS(y0, add_constant(y1)).fit()
-            spread_std = float(ols_fit.resid.std())
-            return {
-                "ticker1": t1,
-                "ticker2": t2,
-                "coint_t": coint_t,
-                "pvalue": pvalue,
-                "crit_1pct": float(crit_values[0]) if crit_values is not None else None,
-                "crit_5pct": float(crit_values[1]) if crit_values is not None else None,
-                "crit_10pct": float(crit_values[2]) if crit_values is not None else None,
-                "cointegrated_5pct": pvalue < 0.05,
-                "collinear": collinear,
-                "spread_std": spread_std,
-            }
-        except Exception as e:
-            try:
-                ols_fit = OLS(y0, add_constant(y1)).fit()
-                spread_std = float(ols_fit.resid.std())
-            except Exception:
-                spread_std = None
-            return {
-                "ticker1": t1,
-                "ticker2": t2,
-                "coint_t": None,
-                "pvalue": None,
-                "crit_1pct": None,
-                "crit_5pct": None,
-                "crit_10pct": None,
-                "cointegrated_5pct": False,
-                "collinear": False,
-                "spread_std": spread_std,
-                "error": str(e),
-            }
+# coint() flags y0/y1 as collinear (and skips the ADF) when R² reaches this
+_COLLINEAR_R2 = 1 - 100 * np.sqrt(np.finfo(float).eps)
+# Below this sum of squared deviations a series is flat (rounding noise around its mean)
+_FLAT_SXX = 1e-12
+# coint()'s error for a flat y0 (its residual is constant, so the ADF rejects it)
+_FLAT_Y0_ERROR = "Invalid input, x is constant"
+
+
+def label_results(results: list[dict], columns) -> list[dict]:
+    """Replace the column indices in ticker1/ticker2 with their labels from columns (in place)."""
+    names = list(columns)
+    for r in results:
+        r["ticker1"], r["ticker2"] = names[r["ticker1"]], names[r["ticker2"]]
+    return results
+
+
+def _error_result(t1, t2, spread_std, error: str) -> dict:
+    """Result dict for a pair the test could not be run on."""
+    return {
+        "ticker1": t1,
+        "ticker2": t2,
+        "coint_t": None,
+        "pvalue": None,
+        "crit_1pct": None,
+        "crit_5pct": None,
+        "crit_10pct": None,
+        "cointegrated_5pct": False,
+        "collinear": False,
+        "spread_std": spread_std,
+        "error": error,
+    }
+
+
+@njit(nogil=True, cache=True, error_model="numpy")
+def _engle_granger(y0, y1):
+    """
+    Same statistic as coint(y0, y1, autolag=None, maxlag=0): OLS of y0 on (1, y1),
+    then ADF(0) without constant on the residuals, both from one set of moments.
+    Returns (coint_t, spread_std, collinear); coint_t is -inf when collinear
+    and NaN when y0 is flat, the case coint() rejects as constant input.
+    """
+    n = y0.shape[0]
+    mx = 0.0
+    my = 0.0
+    for t in range(n):
+        mx += y1[t]
+        my += y0[t]
+    mx /= n
+    my /= n
+    sxx = 0.0
+    sxy = 0.0
+    syy = 0.0
+    for t in range(n):
+        dx = y1[t] - mx
+        dy = y0[t] - my
+        sxx += dx * dx
+        sxy += dx * dy
+        syy += dy * dy
+    # Flat y1: OLS (pinv) gives slope 0 and the spread is y0 around its mean
+    flat = sxx < _FLAT_SXX
+    beta = 0.0 if flat else sxy / sxx
+
+    # Spread = residual from cointegrating regression (y0 on y1); std measures deviation from mean.
+    # The same pass accumulates the ADF(0) sums of lagged resid and its first difference.
+    ssr = 0.0
+    sll = 0.0
+    sld = 0.0
+    sdd = 0.0
+    prev = 0.0
+    for t in range(n):
+        e = (y0[t] - my) - beta * (y1[t] - mx)
+        ssr += e * e
+        if t > 0:
+            d = e - prev
+            sll += prev * prev
+            sld += prev * d
+            sdd += d * d
+        prev = e
+    spread_std = np.sqrt(ssr / n)
+    if syy < _FLAT_SXX:
+        return np.nan, spread_std, False
+    if not flat and sxy * sxy >= _COLLINEAR_R2 * sxx * syy:
+        return -np.inf, spread_std, True
+    rho = sld / sll
+    # n - 1 observations, one regressor
+    sigma2 = (sdd - rho * sld) / (n - 2)
+    return rho / np.sqrt(sigma2 / sll), spread_std, False
+
+
+@njit(parallel=True, nogil=True, cache=True)
+def _screen_pairs(arr, valid, left, right, min_obs, n_chunks):
+    """
+    _engle_granger for each pair (left[k], right[k]) of columns, on the rows
+    where both are valid. Returns a (pairs, 4) array of n, coint_t, spread_std,
+    collinear; the last three are left NaN when n < min_obs.
+    Pairs are split into n_chunks contiguous chunks spread over threads; each
+    chunk allocates one y0/y1 buffer pair and reuses it for all its pairs.
+    """
+    n_obs = arr.shape[0]
+    n_pairs = left.shape[0]
+    out = np.full((n_pairs, 4), np.nan)
+    for c in prange(n_chunks):
+        y0 = np.empty(n_obs)
+        y1 = np.empty(n_obs)
+        for k in range(c * n_pairs // n_chunks, (c + 1) * n_pairs // n_chunks):
+            i = left[k]
+            j = right[k]
+            n = 0
+            for t in range(n_obs):
+                if valid[t, i] and valid[t, j]:
+                    y0[n] = arr[t, i]
+                    y1[n] = arr[t, j]
+                    n += 1
+            out[k, 0] = n
+            if n >= min_obs:
+                coint_t, spread_std, collinear = _engle_granger(y0[:n], y1[:n])
+                out[k, 1] = coint_t
+                out[k, 2] = spread_std
+                out[k, 3] = collinear
+    return out
+
+
+def _result(t1, t2, coint_t, spread_std, collinear, nobs) -> dict:
+    """Result dict with MacKinnon p-value and critical values for a pair's statistic."""
+    pvalue = mackinnonp(coint_t, regression="c", N=2)
+    crit_1pct, crit_5pct, crit_10pct = _crit_values(nobs)
+    return {
+        "ticker1": t1,
+        "ticker2": t2,
+        "coint_t": coint_t,
+        "pvalue": pvalue,
+        "crit_1pct": crit_1pct,
+        "crit_5pct": crit_5pct,
+        "crit_10pct": crit_10pct,
+        "cointegrated_5pct": pvalue < 0.05,
+        "collinear": collinear,
+        "spread_std": spread_std,
+    }
+
+
+@lru_cache(maxsize=None)
+def _crit_values(nobs: int) -> tuple[float, float, float]:
+    """MacKinnon 1%/5%/10% critical values, as coint() looks them up for nobs observations."""
+    crit = mackinnoncrit(N=2, regression="c", nobs=nobs - 1)
+    return float(crit[0]), float(crit[1]), float(crit[2])
+
+
+def correlated_pairs(wide: np.ndarray, min_abs_corr: float) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Pairs (i, j), i < j, of a dates x tickers panel whose Pearson correlation
+    over their common rows has |corr| > min_abs_corr. NaN marks a missing price.
+
+    Weakly correlated pairs leave a residual close to y0 itself, which the ADF
+    will not reject, so these are the pairs worth an Engle-Granger test.
+    The pairwise sums come from a few matrix products over the whole panel.
+    Returns (left, right) index arrays, as taken by screen_all_pairs.
+    """
+    arr = np.asarray(wide, dtype=np.float64)
+    valid = ~np.isnan(arr)
+    m = valid.astype(np.float64)
+    # Center each column on its own mean to keep the sums well conditioned
+    x = np.where(valid, arr - np.nanmean(arr, axis=0), 0.0)
+    n = m.T @ m
+    sx = x.T @ m  # sx[i, j] = sum of x_i over rows where j is also present
+    sxx = (x * x).T @ m
+    sxy = x.T @ x
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cov = n * sxy - sx * sx.T
+        corr = cov / np.sqrt((n * sxx - sx * sx) * (n * sxx - sx * sx).T)
+    left, right = np.triu_indices(arr.shape[1], k=1)
+    keep = np.abs(corr[left, right]) > min_abs_corr  # NaN (flat or no overlap) fails
+    return left[keep], right[keep]
+
+
+def screen_all_pairs(wide: np.ndarray, columns=None, pairs=None) -> list[dict]:
+    """
+    Engle-Granger test (same statistic as coint(y0, y1, autolag=None, maxlag=0))
+    for every pair (i, j), i < j, of a dates x tickers panel. NaN marks a missing price.
+
+    Pairs are spread over threads by the compiled _screen_pairs kernel, which
+    releases the GIL, so no worker processes or shared memory are needed.
+
+    columns: labels for ticker1/ticker2 in the results; None = column indices.
+    pairs: (left, right) column index arrays to test instead of every pair,
+    e.g. from correlated_pairs.
+    Returns a list of result dicts; pairs with fewer than MIN_OBS common rows are skipped.
+    """
+    arr = np.asfortranarray(wide, dtype=np.float64)
+    if pairs is None:
+        left, right = np.triu_indices(arr.shape[1], k=1)
+    else:
+        left, right = (np.asarray(p, dtype=np.intp) for p in pairs)
+    # A few chunks per thread keeps the threads evenly loaded
+    n_chunks = max(1, min(len(left), 4 * get_num_threads()))
+    stats = _screen_pairs(arr, ~np.isnan(arr), left, right, MIN_OBS, n_chunks)
+
+    results = []
+    for k in np.flatnonzero(stats[:, 0] >= MIN_OBS):
+        n, coint_t, spread_std, collinear = stats[k]
+        if np.isnan(coint_t):
+            results.append(_error_result(int(left[k]), int(right[k]), float(spread_std), _FLAT_Y0_ERROR))
+            continue
+        results.append(_result(
+            int(left[k]), int(right[k]), float(coint_t), float(spread_std), bool(collinear), int(n)
+        ))
+    return label_results(results, columns) if columns is not None else results
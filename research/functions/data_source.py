@@ -7,8 +7,10 @@ from datetime import date
 import io
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 
+import numpy as np
 import pandas as pd
 import yfinance as yf
 
@@ -16,6 +18,19 @@ import yfinance as yf
 logging.getLogger('yfinance').setLevel(logging.CRITICAL)
 
 PRICE_COLUMNS = ["date", "ticker", "open", "high", "low", "close", "volume", "adj_close"]
+MAX_TICKERS_PER_REQUEST = 20
+MAX_CONCURRENT_REQUESTS = 16
+
+# yfinance column labels -> PRICE_COLUMNS names
+_COL_MAP = {
+    "Date": "date",
+    "Open": "open",
+    "High": "high",
+    "Low": "low",
+    "Close": "close",
+    "Adj Close": "adj_close",
+    "Volume": "volume",
+}
 
 
 @contextmanager
@@ -32,6 +47,9 @@ def suppress_stderr():
 def fetch_prices(tickers: list[str], start_date: date, end_date: date) -> pd.DataFrame:
     """
     Fetch OHLCV + adj_close from yfinance.
+
+    Large ticker lists are split into batches of at most MAX_TICKERS_PER_REQUEST
+    that are downloaded concurrently (up to MAX_CONCURRENT_REQUESTS at a time).
     
     Args:
         tickers: List of ticker symbols
@@ -44,17 +62,46 @@ def fetch_prices(tickers: list[str], start_date: date, end_date: date) -> pd.Dat
     if not tickers:
         return _empty_prices_df()
 
+    n_batches = -(-len(tickers) // MAX_TICKERS_PER_REQUEST)
+    # Even batch sizes, so a list just over the limit doesn't leave a 1-ticker batch
+    batches = [
+        tickers[k * len(tickers) // n_batches : (k + 1) * len(tickers) // n_batches]
+        for k in range(n_batches)
+    ]
+
+    # stderr is swapped once here: suppress_stderr is not safe to nest across threads
+    with suppress_stderr():
+        if n_batches == 1:
+            # One batch: let yfinance thread over its tickers as before
+            parts = [_fetch_batch(batches[0], start_date, end_date, threads=True)]
+        else:
+            # Many batches: parallelize across batches, not inside each download.
+            # Needs yfinance >= 1.4: older download() shares module-level result
+            # dicts, so concurrent calls overwrite each other's tickers
+            with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_REQUESTS, n_batches)) as ex:
+                parts = list(ex.map(lambda b: _fetch_batch(b, start_date, end_date, threads=False), batches))
+
+    parts = [p for p in parts if not p.empty]
+    if not parts:
+        return _empty_prices_df()
+    df = parts[0] if len(parts) == 1 else pd.concat(parts, ignore_index=True)
+
+    # Ensure all required columns exist
+    return _ensure_price_columns(df)
+
+
+def _fetch_batch(tickers: list[str], start_date: date, end_date: date, threads: bool) -> pd.DataFrame:
+    """Download one batch of tickers with yf.download and convert to long format."""
     try:
-        with suppress_stderr():
-            data = yf.download(
-                tickers,
-                start=start_date.strftime("%Y-%m-%d"),
-                end=end_date.strftime("%Y-%m-%d"),
-                group_by="ticker",
-                auto_adjust=False,
-                progress=False,
-                threads=True,
-            )
+        data = yf.download(
+            tickers,
+            start=start_date.strftime("%Y-%m-%d"),
+            end=end_date.strftime("%Y-%m-%d"),
+            group_by="ticker",
+            auto_adjust=False,
+            progress=False,
+            threads=threads,
+        )
     except Exception as e:
         print(f"ERROR: Failed to download data: {e}")
         return _empty_prices_df()
@@ -63,10 +110,7 @@ def fetch_prices(tickers: list[str], start_date: date, end_date: date) -> pd.Dat
         return _empty_prices_df()
 
     # Convert to long format
-    df = _convert_to_long_format(data, tickers)
-    
-    # Ensure all required columns exist
-    return _ensure_price_columns(df)
+    return _convert_to_long_format(data, tickers)
 
 
 def _empty_prices_df() -> pd.DataFrame:
@@ -74,14 +118,17 @@ def _empty_prices_df() -> pd.DataFrame:
     return pd.DataFrame(columns=PRICE_COLUMNS)
 
 
+def _column_name(c) -> str:
+    """Normalized name (lowercase with underscores) for one yfinance column label."""
+    label = c[0] if isinstance(c, tuple) else c
+    name = _COL_MAP.get(label)
+    return name if name is not None else str(label).lower().replace(" ", "_")
+
+
 def _normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
     """Normalize column names to lowercase with underscores."""
-    df.columns = [
-        c[0].lower().replace(" ", "_") if isinstance(c, tuple) 
-        else str(c).lower().replace(" ", "_")
-        for c in df.columns
-    ]
-    return df.rename(columns={"adj close": "adj_close"})
+    df.columns = [_column_name(c) for c in df.columns]
+    return df
 
 
 def _convert_to_long_format(data: pd.DataFrame, tickers: list[str]) -> pd.DataFrame:
@@ -94,7 +141,7 @@ def _convert_to_long_format(data: pd.DataFrame, tickers: list[str]) -> pd.DataFr
 def _process_single_ticker(data: pd.DataFrame, ticker: str) -> pd.DataFrame:
     """Process data for a single ticker."""
     try:
-        df = data.reset_index().rename(columns={"Date": "date"})
+        df = data.reset_index()
         df["ticker"] = ticker
         df = _normalize_columns(df)
         
@@ -109,8 +156,7 @@ def _process_single_ticker(data: pd.DataFrame, ticker: str) -> pd.DataFrame:
 
 def _process_multiple_tickers(data: pd.DataFrame, tickers: list[str]) -> pd.DataFrame:
     """Process data for multiple tickers."""
-    dfs = []
-    
+    frames = []
     for ticker in tickers:
         try:
             # Extract ticker data from multi-index columns
@@ -118,31 +164,40 @@ def _process_multiple_tickers(data: pd.DataFrame, tickers: list[str]) -> pd.Data
                 ticker_data = data.xs(ticker, axis=1, level=0)
             else:
                 ticker_data = data[ticker]
-            
-            # Skip if no valid data
-            ticker_data = ticker_data.dropna(how="all")
-            if ticker_data.empty:
-                continue
-            
-            # Format the data
-            df = ticker_data.reset_index()
-            df["ticker"] = ticker
-            df = _normalize_columns(df)
-            
-            # Ensure 'date' column exists
-            if "date" not in df.columns and len(df.columns) > 0:
-                df = df.rename(columns={df.columns[0]: "date"})
-            
-            dfs.append(df)
-            
         except (KeyError, Exception):
             # Silently skip tickers with no data
             continue
-    
-    if not dfs:
+
+        # Skip if no valid data
+        ticker_data = ticker_data.dropna(how="all")
+        if not ticker_data.empty:
+            frames.append((ticker, ticker_data))
+
+    if not frames:
         return _empty_prices_df()
-    
-    return pd.concat(dfs, ignore_index=True)
+
+    # Fill one preallocated array per output column instead of concatenating per-ticker frames
+    total = sum(len(d) for _, d in frames)
+    names = [{_column_name(c): c for c in d.columns} for _, d in frames]
+    fields = {}
+    for col in PRICE_COLUMNS[2:]:
+        if any(col in n for n in names):
+            # Tickers without this column get NaN, which makes the column float
+            dtypes = [d[n[col]].dtype if col in n else np.float64 for (_, d), n in zip(frames, names)]
+            fields[col] = np.empty(total, dtype=np.result_type(*dtypes))
+    dates = np.empty(total, dtype=data.index.values.dtype)
+    ticker_col = np.empty(total, dtype=object)
+
+    start = 0
+    for (ticker, ticker_data), n in zip(frames, names):
+        end = start + len(ticker_data)
+        dates[start:end] = ticker_data.index.values
+        ticker_col[start:end] = ticker
+        for col, arr in fields.items():
+            arr[start:end] = ticker_data[n[col]].to_numpy() if col in n else np.nan
+        start = end
+
+    return pd.DataFrame({"date": dates, "ticker": ticker_col, **fields}, copy=False)
 
 
 def _ensure_price_columns(df: pd.DataFrame) -> pd.DataFrame:
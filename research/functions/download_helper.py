@@ -1,23 +1,70 @@
 """
-Helper for downloading and managing monthly price CSV files.
+Helper for downloading and managing monthly price files (CSV or Parquet).
 Exposes date/path utilities and download orchestration with simple log output.
+
+FORMAT picks the format new months are written in (existing months keep theirs);
+readers accept both, and migrate_csv_to_parquet converts an existing CSV store. New rows for an
+existing Parquet month go to a sibling PRICES_YYYY-M##.part-N.parquet instead
+of rewriting the month; compact_price_files folds the parts back in.
+list_price_files, part_paths and read_csv_table are the file listing and
+CSV reader shared with load_data.
 """
 
 import calendar
+import os
+import re
 from dataclasses import dataclass
 from datetime import date, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pac
+import pyarrow.dataset as pads
+import pyarrow.parquet as pq
+
+FORMAT = "parquet"  # "csv" or "parquet"
+PRICE_SUFFIXES = (".csv", ".parquet")
+_PRICES_RE = re.compile(r"^PRICES_(\d{4})-M(0[1-9]|1[0-2])(?:\.part-(\d+))?$")  # file stem
+# Fixed CSV schema, shared by every CSV read: Parquet's types, no per-column
+# inference except volume (int64, or float64 once it holds NaN)
+_CSV_TYPES = {
+    "date": pa.date32(),
+    "ticker": pa.string(),
+    **{c: pa.float64() for c in ("open", "high", "low", "close", "adj_close")},
+}
+_CSV_READ = pac.ReadOptions(block_size=1 << 20)
+_CSV_CONVERT = pac.ConvertOptions(column_types=_CSV_TYPES)
+# CSV months scanned as a dataset
+_CSV_DATASET_FORMAT = pads.CsvFileFormat(read_options=_CSV_READ, convert_options=_CSV_CONVERT)
+# Tickers never hold delimiters or quotes: write fields unquoted, as to_csv did
+_CSV_WRITE = pac.WriteOptions(include_header=False, quoting_style="none")
+# abs data dir -> ((dir, st_mtime_ns) for every dir in the tree, sorted PRICES paths)
+_LISTING_CACHE: dict[str, tuple[tuple[tuple[str, int], ...], list[Path]]] = {}
+
+
+_ROOT_MARKERS = frozenset({".git", "requirements.txt"})
+
 
 def find_project_root(start: Path | None = None) -> Path:
     """Walk up from *start* (default: cwd) until a project marker is found."""
-    current = Path(start or Path.cwd()).resolve()
-    markers = [".git", "requirements.txt"]
+    return _find_project_root(Path(start or Path.cwd()).resolve())
+
+
+@lru_cache(maxsize=32)
+def _find_project_root(current: Path) -> Path:
+    """Cached walk from a resolved path; one scandir per ancestor."""
     while current != current.parent:
-        if any((current / m).exists() for m in markers):
-            return current
+        try:
+            with os.scandir(current) as it:
+                if any(entry.name in _ROOT_MARKERS for entry in it):
+                    return current
+        except OSError:
+            pass
         current = current.parent
     raise FileNotFoundError("Could not find project root")
 
@@ -34,6 +81,7 @@ class DownloadStats:
         return f"Updated: {self.updated} | Up to date: {self.up_to_date} | No new data: {self.no_trading_days}"
 
 
+@lru_cache(maxsize=None)
 def month_range(year: int, month: int) -> tuple[date, date]:
     """First and last day of the given month."""
     last_day = calendar.monthrange(year, month)[1]
@@ -41,66 +89,315 @@ def month_range(year: int, month: int) -> tuple[date, date]:
 
 
 def months_from(start: date, end: date):
-    """Yield (year, month) from start through end."""
-    current = date(start.year, start.month, 1)
-    end_first = date(end.year, end.month, 1)
-    while current <= end_first:
-        yield current.year, current.month
-        if current.month == 12:
-            current = date(current.year + 1, 1, 1)
-        else:
-            current = date(current.year, current.month + 1, 1)
+    """Iterate (year, month) from start through end."""
+    months = pd.period_range(start, end, freq="M")
+    return zip(months.year.tolist(), months.month.tolist())
 
 
 def normalize_dates(df: pd.DataFrame) -> pd.DataFrame:
-    """Ensure 'date' column is date (not datetime)."""
+    """
+    Ensure 'date' column is naive datetime64 at midnight (calendar days).
+    Frames already in that form are returned as is, without a copy.
+    """
     if "date" not in df.columns:
         return df
-    if pd.api.types.is_datetime64_any_dtype(df["date"]):
-        df = df.copy()
-        df["date"] = pd.to_datetime(df["date"]).dt.date
+    col = df["date"]
+    converted = not pd.api.types.is_datetime64_any_dtype(col)
+    if converted:
+        col = pd.to_datetime(col)
+    if isinstance(col.dtype, pd.DatetimeTZDtype):
+        col = col.dt.tz_localize(None)  # keep the local calendar day
+        converted = True
+    values = col.to_numpy()
+    # Truncating to datetime64[D] is a plain integer cast; no Python date objects
+    days = values.astype("datetime64[D]")
+    if not converted and (days == values).all():
+        return df
+    # Shallow: only the date column is replaced, the other columns stay shared
+    df = df.copy(deep=False)
+    df["date"] = days.astype(values.dtype)
     return df
 
 
 def find_last_month_with_data(data_dir: Path) -> date | None:
-    """Earliest month to resume from (from latest existing PRICES_*.csv)."""
+    """Earliest month to resume from (from latest existing PRICES_* file)."""
     data_dir = Path(data_dir)
     if not data_dir.exists():
         return None
-    files = sorted(data_dir.rglob("PRICES_*.csv"), reverse=True)
-    if not files:
-        return None
-    stem = files[0].stem  # PRICES_YYYY-M##
-    try:
-        parts = stem.replace("_", "-").split("-")
-        year, month = int(parts[1]), int(parts[2][1:])
-        return date(year, month, 1)
-    except (IndexError, ValueError):
-        return None
+    # Only the newest year folder that has a PRICES file matters; don't walk the whole tree
+    with os.scandir(data_dir) as entries:
+        years = sorted((int(e.name) for e in entries if e.is_dir() and e.name.isdigit()), reverse=True)
+    for year in years:
+        with os.scandir(data_dir / str(year)) as entries:
+            latest = max(
+                (
+                    (int(m[1]), int(m[2]))
+                    for e in entries
+                    if e.name.endswith(PRICE_SUFFIXES)
+                    and (m := _PRICES_RE.match(os.path.splitext(e.name)[0]))
+                ),
+                default=None,
+            )
+        if latest is not None:
+            return date(latest[0], latest[1], 1)
+    return None
 
 
 def get_month_path(data_dir: Path, year: int, month: int) -> Path:
-    """Path for PRICES_YYYY-M##.csv; ensures parent dir exists."""
+    """
+    Path for PRICES_YYYY-M##: the month's existing file in either format, else
+    .<FORMAT> for a new month. Ensures parent dir exists.
+    """
     data_dir = Path(data_dir)
-    path = data_dir / str(year) / f"PRICES_{year}-M{month:02d}.csv"
+    path = data_dir / str(year) / f"PRICES_{year}-M{month:02d}.{FORMAT}"
     path.parent.mkdir(parents=True, exist_ok=True)
+    if not path.exists():
+        for suffix in PRICE_SUFFIXES:
+            if (other := path.with_suffix(suffix)).exists():
+                return other
     return path
 
 
+def _scan_prices(root: Path | str, dirs: list[tuple[str, int]] | None = None):
+    """
+    Yield os.DirEntry for every PRICES_* file (any supported format) under root.
+    scandir reports the entry type from the directory listing, so no per-file stat.
+    dirs: if given, (path, st_mtime_ns) of each directory listed is appended.
+    """
+    try:
+        if dirs is not None:
+            dirs.append((os.fspath(root), os.stat(root).st_mtime_ns))
+        entries = os.scandir(root)
+    except FileNotFoundError:
+        return
+    with entries:
+        for e in entries:
+            if e.is_dir(follow_symlinks=False):
+                yield from _scan_prices(e.path, dirs)
+            elif e.name.startswith("PRICES_") and e.name.endswith(PRICE_SUFFIXES):
+                yield e
+
+
+def list_price_files(data_dir: Path | str) -> list[Path]:
+    """
+    PRICES_YYYY-M## paths under data_dir, by (year, month, part). The listing is cached and reused while
+    no directory in the tree has a new mtime; writes here also drop the cache.
+    """
+    key = os.path.abspath(data_dir)
+    hit = _LISTING_CACHE.get(key)
+    if hit is not None:
+        try:
+            if all(os.stat(d).st_mtime_ns == m for d, m in hit[0]):
+                return list(hit[1])
+        except OSError:
+            pass
+    dirs: list[tuple[str, int]] = []
+    keyed = []
+    for e in _scan_prices(key, dirs):
+        stem, suffix = os.path.splitext(e.name)
+        if m := _PRICES_RE.match(stem):
+            # (year, month, part) from the one match; the base file (part 0) sorts first
+            keyed.append(((int(m[1]), int(m[2]), int(m[3] or 0), suffix), Path(e.path)))
+    keyed.sort(key=lambda kp: kp[0])
+    files = [p for _, p in keyed]
+    _LISTING_CACHE[key] = (tuple(dirs), files)
+    return list(files)
+
+
+@lru_cache(maxsize=None)
+def _csv_convert(columns: tuple[str, ...] | None) -> pac.ConvertOptions:
+    """Shared convert options reading only *columns* (None = all)."""
+    if columns is None:
+        return _CSV_CONVERT
+    return pac.ConvertOptions(column_types=_CSV_TYPES, include_columns=list(columns))
+
+
+def read_csv_table(path: Path, columns: list[str] | None = None) -> pa.Table:
+    """
+    Read one CSV month as an Arrow table with the fixed schema; columns: read only these.
+    A torn last row (left by an interrupted write) is skipped with a warning;
+    any other malformed row raises pyarrow.ArrowInvalid.
+    """
+    def on_invalid(row) -> str:
+        if row.text.rstrip("\r") != _last_line(path):
+            return "error"
+        print(f"WARNING: {path}: skipped torn last row {row.text!r}")
+        return "skip"
+
+    convert = _csv_convert(tuple(columns) if columns is not None else None)
+    parse = pac.ParseOptions(invalid_row_handler=on_invalid)
+    return pac.read_csv(path, read_options=_CSV_READ, parse_options=parse, convert_options=convert)
+
+
+def _last_line(path: Path) -> str:
+    """Last non-empty line of a text file, read from its tail only."""
+    with open(path, "rb") as f:
+        f.seek(max(0, f.seek(0, os.SEEK_END) - 4096))
+        tail = f.read()
+    return tail.rstrip(b"\r\n").rsplit(b"\n", 1)[-1].rstrip(b"\r").decode("utf-8", "replace")
+
+
+def _read_prices(path: Path, columns: list[str] | None = None) -> pd.DataFrame:
+    """Read one monthly file, CSV or Parquet by suffix, with 'date' as datetime64."""
+    if path.suffix == ".parquet":
+        df = pd.read_parquet(path, columns=columns)
+        # Parquet stores dates as date32; return datetime64 like the CSV branch
+        df["date"] = pd.to_datetime(df["date"])
+        return df
+    # Arrow parses floats exactly, so a read + rewrite cycle leaves values unchanged
+    return read_csv_table(path, columns).to_pandas(date_as_object=False)
+
+
+def part_paths(path: Path) -> list[Path]:
+    """Append parts of a Parquet monthly file, in the order they were written."""
+    if path.suffix != ".parquet":
+        return []
+    parts = path.parent.glob(f"{path.stem}.part-*.parquet")
+    return sorted(parts, key=lambda p: int(p.stem.rsplit("-", 1)[1]))
+
+
 def load_existing(path: Path) -> pd.DataFrame:
-    """Load CSV and normalize dates."""
-    df = pd.read_csv(path, parse_dates=["date"])
-    return normalize_dates(df)
+    """Load monthly file (plus any append parts) and normalize dates."""
+    path = Path(path)
+    parts = part_paths(path)
+    if not parts:
+        return normalize_dates(_read_prices(path))
+    df = pd.concat([_read_prices(p) for p in [path, *parts]], ignore_index=True)
+    # Same rule as a rewrite: the first row seen for a (date, ticker) wins
+    return normalize_dates(df.take(_sorted_unique_rows(df)))
+
+
+def _sorted_unique_rows(df: pd.DataFrame) -> np.ndarray:
+    """Row positions ordering df by (date, ticker), keeping the first row of each duplicate pair."""
+    date_codes, _ = pd.factorize(df["date"], sort=True, use_na_sentinel=False)
+    ticker_codes, _ = pd.factorize(df["ticker"], sort=True, use_na_sentinel=False)
+    # Stable, so the first occurrence of a key leads its run
+    order = np.lexsort((ticker_codes, date_codes))
+    d, t = date_codes[order], ticker_codes[order]
+    keep = np.ones(len(order), dtype=bool)
+    keep[1:] = (d[1:] != d[:-1]) | (t[1:] != t[:-1])
+    return order[keep]
+
+
+def _to_table(df: pd.DataFrame) -> pa.Table:
+    """Arrow table for writing; dates as calendar dates (date32, written as YYYY-MM-DD), not datetime64."""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    i = table.schema.get_field_index("date")
+    if i >= 0 and pa.types.is_timestamp(table.schema.field(i).type):
+        table = table.set_column(i, "date", pc.cast(table["date"], pa.date32()))
+    return table
+
+
+def _append_csv_rows(df: pd.DataFrame, path: Path) -> bool:
+    """
+    Append rows to the end of a CSV month in its header's column order.
+    False if the columns differ or the file does not end in a complete line.
+    """
+    with open(path, "rb") as f:
+        header = f.readline().decode("utf-8").rstrip("\r\n").split(",")
+        f.seek(-1, os.SEEK_END)
+        complete = f.read(1) == b"\n"
+    if not complete or sorted(header) != sorted(df.columns):
+        return False
+    _LISTING_CACHE.clear()
+    table = _to_table(df[header])
+    with open(path, "r+b") as f:
+        size = f.seek(0, os.SEEK_END)
+        try:
+            pac.write_csv(table, f, write_options=_CSV_WRITE)
+        except BaseException:
+            # Failed or interrupted (e.g. Ctrl-C): cut the month back to its original rows
+            f.truncate(size)
+            raise
+    return True
+
+
+def save_price_data(df: pd.DataFrame, path: Path, already_sorted: bool = False) -> None:
+    """
+    Dedupe by (date, ticker), sort, and write CSV or Parquet (by path suffix).
+    already_sorted: caller guarantees df is sorted and unique by (date, ticker); write as is.
+    """
+    path = Path(path)
+    _LISTING_CACHE.clear()
+    table = _to_table(df if already_sorted else df.take(_sorted_unique_rows(df)))
+    # Write next to the target and swap in, so readers never see a half-written month
+    tmp = path.with_name(path.name + ".tmp")
+    if path.suffix == ".parquet":
+        pq.write_table(table, tmp, compression="zstd", compression_level=3)
+    else:
+        with open(tmp, "wb") as f:
+            # Arrow quotes header names whatever the quoting style, so write the header here
+            f.write((",".join(table.column_names) + "\n").encode())
+            pac.write_csv(table, f, write_options=_CSV_WRITE)
+    os.replace(tmp, path)
+
+
+def append_price_data(df: pd.DataFrame, path: Path, existing_dates: pd.Series | None = None) -> None:
+    """
+    Add rows to a monthly file. An existing Parquet month gets a new part file
+    holding only these rows. A CSV month gets the rows appended to its end when
+    they all come after its last date, and is rewritten with existing + new rows
+    otherwise (existing_dates: the file's date column in file order, if the
+    caller already read it, to skip re-reading it).
+    """
+    path = Path(path)
+    if not path.exists():
+        save_price_data(df, path)
+    elif path.suffix == ".parquet":
+        parts = part_paths(path)
+        n = int(parts[-1].stem.rsplit("-", 1)[1]) + 1 if parts else 1
+        save_price_data(df, path.with_name(f"{path.stem}.part-{n}.parquet"))
+    else:
+        new = normalize_dates(df.take(_sorted_unique_rows(df)))
+        # Only the dates are needed to tell whether the new rows go after the file
+        dates = existing_dates if existing_dates is not None else _read_prices(path, columns=["date"])["date"]
+        # Usual case: the file is in date order and every new row is later, so
+        # appending the sorted new rows keeps it in date order with no new duplicates
+        in_order = dates.empty or (
+            dates.is_monotonic_increasing and new["date"].iloc[0] > dates.iloc[-1]
+        )
+        if in_order and _append_csv_rows(new, path):
+            return
+        # A CSV month read back is not necessarily sorted by ticker or unique: dedupe and sort
+        save_price_data(pd.concat([load_existing(path), new], ignore_index=True), path)
+
+
+def compact_price_files(data_dir: Path) -> int:
+    """Fold Parquet append parts back into their monthly files. Return count of months compacted."""
+    compacted = 0
+    # Listed up front: the loop rewrites and unlinks files in the scanned directories
+    months = [Path(e.path) for e in _scan_prices(data_dir) if e.name.endswith(".parquet") and ".part-" not in e.name]
+    for path in months:
+        parts = part_paths(path)
+        if not parts:
+            continue
+        save_price_data(load_existing(path), path)
+        for p in parts:
+            p.unlink()
+        _LISTING_CACHE.clear()
+        compacted += 1
+    return compacted
 
 
-def save_price_data(df: pd.DataFrame, path: Path) -> None:
-    """Dedupe by (date, ticker), sort, and write CSV."""
-    out = (
-        df.drop_duplicates(subset=["date", "ticker"])
-        .sort_values(["date", "ticker"])
-        .reset_index(drop=True)
-    )
-    out.to_csv(path, index=False)
+def migrate_csv_to_parquet(data_dir: Path) -> int:
+    """
+    Rewrite every PRICES_*.csv under data_dir as .parquet and remove the CSV. Return count converted.
+    A month that already has a .parquet file (and parts) is merged with it; the CSV's row
+    wins a duplicate (date, ticker), as in load_prices.
+    """
+    converted = 0
+    for f in [Path(e.path) for e in _scan_prices(data_dir) if e.name.endswith(".csv")]:
+        target = f.with_suffix(".parquet")
+        df = load_existing(f)
+        parts = part_paths(target)
+        if target.exists():
+            df = pd.concat([df, load_existing(target)], ignore_index=True)
+        save_price_data(df, target)
+        for p in [*parts, f]:
+            p.unlink()
+        _LISTING_CACHE.clear()
+        converted += 1
+    return converted
 
 
 def update_existing_file(
@@ -111,8 +408,10 @@ def update_existing_file(
     stats: DownloadStats,
 ) -> tuple[bool, int]:
     """Append new data to existing file. Return (updated, rows_added)."""
-    existing = load_existing(path)
-    last_date = existing["date"].max()
+    # Only the date column is needed for the last date (datetime64, numpy max)
+    path = Path(path)
+    dates = pd.concat([_read_prices(p, columns=["date"])["date"] for p in [path, *part_paths(path)]])
+    last_date = dates.max().date()
     fetch_start = last_date + timedelta(days=1)
     if fetch_start > end_cap:
         stats.up_to_date += 1
@@ -121,8 +420,7 @@ def update_existing_file(
     if new_data.empty:
         stats.no_trading_days += 1
         return False, 0
-    combined = pd.concat([existing, normalize_dates(new_data)], ignore_index=True)
-    save_price_data(combined, path)
+    append_price_data(normalize_dates(new_data), path, existing_dates=dates)
     return True, len(new_data)
 
 
@@ -143,11 +441,11 @@ def create_new_file(
 
 
 def cleanup_existing_files(data_dir: Path) -> int:
-    """Remove all PRICES_*.csv under data_dir. Return count deleted."""
-    data_dir = Path(data_dir)
+    """Remove all PRICES_* files under data_dir. Return count deleted."""
     deleted = 0
-    for f in data_dir.rglob("PRICES_*.csv"):
-        f.unlink()
+    _LISTING_CACHE.clear()
+    for e in list(_scan_prices(data_dir)):
+        os.unlink(e.path)
         deleted += 1
     return deleted
 
@@ -172,55 +470,67 @@ def determine_start_date(
 
 def get_last_dates_per_ticker(data_dir: Path, tickers: list[str]) -> dict[str, date | None]:
     """
-    Scan all PRICES_*.csv and return the latest date present for each ticker.
+    Scan all PRICES_* files and return the latest date present for each ticker.
     Returns {ticker: max_date or None} for each ticker in the list.
 
-    Uses a single concat + groupby instead of per-file per-ticker lookups.
+    One Arrow dataset scan per file format reads only date and ticker, keeps the
+    requested tickers and takes the max date per ticker; only that result reaches Python.
+    If that scan fails, the format is scanned file by file and only unreadable files are skipped.
     """
-    data_dir = Path(data_dir)
-    ticker_set = set(tickers)
-    paths = list(data_dir.rglob("PRICES_*.csv"))
-    if not paths:
-        return {t: None for t in tickers}
-
-    dfs: list[pd.DataFrame] = []
-    for p in paths:
-        try:
-            df = pd.read_csv(p, usecols=["date", "ticker"], parse_dates=["date"])
-            df = df[df["ticker"].isin(ticker_set)]
-            dfs.append(df)
-        except Exception:
+    paths = list_price_files(Path(data_dir))
+    value_set = pa.array(tickers, pa.string())
+
+    def scan(files: list[str], fmt) -> pa.Table:
+        if fmt is _CSV_DATASET_FORMAT and len(files) == 1:
+            # One CSV on its own: the reader that tolerates a torn last row
+            table = read_csv_table(Path(files[0]), ["date", "ticker"])
+            table = table.filter(pc.is_in(table["ticker"], value_set=value_set))
+        else:
+            table = pads.dataset(files, format=fmt).to_table(
+                columns=["date", "ticker"],
+                filter=pads.field("ticker").isin(value_set),
+            )
+        return table.group_by("ticker").aggregate([("date", "max")])
+
+    last: dict[str, date] = {}
+    for suffix, fmt in ((".csv", _CSV_DATASET_FORMAT), (".parquet", "parquet")):
+        files = [str(p) for p in paths if p.suffix == suffix]
+        if not files:
             continue
-
-    if not dfs:
-        return {t: None for t in tickers}
-
-    combined = pd.concat(dfs, ignore_index=True)
-    combined = normalize_dates(combined)
-    last = combined.groupby("ticker")["date"].max()
+        try:
+            results = [scan(files, fmt)]
+        except (OSError, pa.ArrowInvalid):
+            results = []
+            for f in files:
+                try:
+                    results.append(scan([f], fmt))
+                except (OSError, pa.ArrowInvalid):
+                    continue
+        for by_ticker in results:
+            by_ticker = by_ticker.to_pydict()
+            for t, d in zip(by_ticker["ticker"], by_ticker["date_max"]):
+                if d is not None and (t not in last or d > last[t]):
+                    last[t] = d
     return {t: last.get(t) for t in tickers}
 
 
 def merge_ticker_data_into_monthly_files(data_dir: Path, df: pd.DataFrame) -> None:
     """
     Merge a DataFrame of price rows (date, ticker, ...) into the correct
-    PRICES_YYYY-Mmm.csv files by year/month. Use after fetching by ticker.
+    PRICES_YYYY-Mmm files by year/month. Use after fetching by ticker.
     """
     if df.empty or "date" not in df.columns:
         return
     data_dir = Path(data_dir)
-    df = normalize_dates(df.copy())
-    df["_year"] = pd.to_datetime(df["date"]).dt.year
-    df["_month"] = pd.to_datetime(df["date"]).dt.month
-    for (year, month), grp in df.groupby(["_year", "_month"]):
-        path = get_month_path(data_dir, int(year), int(month))
-        add = grp.drop(columns=["_year", "_month"])
-        if path.exists():
-            existing_df = load_existing(path)
-            combined = pd.concat([existing_df, add], ignore_index=True)
-        else:
-            combined = add
-        save_price_data(combined, path)
+    df = normalize_dates(df)
+    # Months since 1970-01 as one int key; a stable argsort puts each month's rows
+    # in one contiguous run (in their original order), split at the key changes
+    months = df["date"].to_numpy().astype("datetime64[M]").astype(np.int64)
+    order = np.argsort(months, kind="stable")
+    for rows in np.split(order, np.flatnonzero(np.diff(months[order])) + 1):
+        year, month = divmod(int(months[rows[0]]), 12)
+        path = get_month_path(data_dir, 1970 + year, month + 1)
+        append_price_data(df.take(rows), path)
 
 def split_into_contiguous_ranges(
     dates: list[date],
@@ -9,20 +9,24 @@ Features:
   - Retry + exponential backoff on failure / empty response
   - Adaptive delay: short normally, longer after a rate-limit signal
   - Optional per-ticker date filter (backfill keeps only gap dates)
-  - Merge into monthly PRICES CSVs via download_helper
+  - Merge into monthly PRICES files via download_helper, one merge per batch
+    on a background thread while the next batch is fetched
   - FetchResult reports stored rows and failed tickers
 """
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import date
 from pathlib import Path
 from typing import Callable, Union
 
+import numpy as np
 import pandas as pd
 
 from research.functions.data_source import fetch_prices, PRICE_COLUMNS
 from research.functions.download_helper import (
+    compact_price_files,
     merge_ticker_data_into_monthly_files,
     normalize_dates,
 )
@@ -80,40 +84,62 @@ def fetch_and_store(
     for ticker, range_list in normalized.items():
         for r in range_list:
             range_groups.setdefault(r, []).append(ticker)
+    # Every (range, ticker batch) call, partitioned once up front
+    batches = [
+        (start, end, group_tickers[i : i + batch_size])
+        for (start, end), group_tickers in range_groups.items()
+        for i in range(0, len(group_tickers), batch_size)
+    ]
 
     ticker_rows: dict[str, int] = {}
-
-    for (start, end), group_tickers in range_groups.items():
-        print(f"Fetching data {start} to {end} for {",".join(group_tickers)}")
-        for i in range(0, len(group_tickers), batch_size):
-            batch = group_tickers[i : i + batch_size]
+    # Dates to keep as int64 day numbers, matched against the batch's day numbers below
+    keep_days = {t: _day_numbers(pd.DatetimeIndex(sorted(d))) for t, d in (filter_dates or {}).items()}
+
+    # Each merge runs on a background thread, overlapping the next fetch and the
+    # rate-limit sleep. Only one is in flight: it is waited on before the next is
+    # submitted, so a failed merge stops the run and at most one batch is held
+    with ThreadPoolExecutor(max_workers=1) as merger:
+        pending = None
+        for start, end, batch in batches:
+            print(f"Fetching data {start} to {end} for {",".join(batch)}")
             df = _fetch_batch_with_retry(batch, start, end, max_retries, delay)
 
             if df.empty:
                 delay = min(delay * 2, 5.0)
                 continue
 
-            for ticker in batch:
-                ticker_df = df[df["ticker"] == ticker].copy()
-                if ticker_df.empty:
-                    continue
-
+            df = normalize_dates(df)
+            days = _day_numbers(df["date"])
+            kept = []
+            # One partition of the batch instead of a boolean mask per ticker
+            for ticker, rows in df.groupby("ticker", sort=False).indices.items():
                 # Optional: keep only specific dates (backfill use case)
-                if filter_dates and ticker in filter_dates:
-                    ticker_df = normalize_dates(ticker_df)
-                    keep = filter_dates[ticker]
-                    ticker_df = ticker_df[ticker_df["date"].isin(keep)]
-                    if ticker_df.empty:
+                if ticker in keep_days:
+                    rows = rows[np.isin(days[rows], keep_days[ticker], kind="table")]
+                    if not len(rows):
                         continue
-
-                merge_ticker_data_into_monthly_files(data_dir, ticker_df)
-                rows = len(ticker_df)
-                ticker_rows[ticker] = ticker_rows.get(ticker, 0) + rows
+                kept.append(rows)
+                ticker_rows[ticker] = ticker_rows.get(ticker, 0) + len(rows)
+
+            # One merge per batch: each monthly file is touched once, not once per ticker
+            if kept:
+                rows = np.concatenate(kept)
+                # Nothing filtered out: merge the batch frame itself, no row copy
+                batch_df = df if len(rows) == len(df) else df.take(rows)
+                if pending is not None:
+                    pending.result()  # re-raise a failed merge before going on
+                pending = merger.submit(merge_ticker_data_into_monthly_files, data_dir, batch_df)
 
             # Successful call — decay delay back toward base
             delay = max(base_delay, delay * 0.8)
             time.sleep(delay)
 
+        if pending is not None:
+            pending.result()
+
+    # Parquet months got one append part per merge; fold them back once per run
+    compact_price_files(data_dir)
+
     all_tickers = set(ticker_ranges.keys())
     for ticker in all_tickers:
         rows = ticker_rows.get(ticker, 0)
@@ -126,6 +152,12 @@ def fetch_and_store(
 
     return result
 
+
+def _day_numbers(dates) -> np.ndarray:
+    """Days since the epoch (int64) for datetime64 values; small ints, so isin can use a lookup table."""
+    return np.asarray(dates).astype("datetime64[D]").astype(np.int64)
+
+
 def _fetch_batch_with_retry(
     tickers: list[str],
     start: date,
@@ -1,11 +1,19 @@
 """
-Load monthly price CSVs into a single DataFrame. Optional filters: tickers, start_date, end_date.
+Load monthly price files (CSV or Parquet) into a single DataFrame. Optional filters: tickers, start_date, end_date.
+Files are read, concatenated, filtered and sorted as Arrow tables; pandas only sees the result.
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from pathlib import Path
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from research.functions.download_helper import PRICE_SUFFIXES, list_price_files, part_paths, read_csv_table
 
 DATA_DIR = Path(__file__).resolve().parent.parent.parent / "data"
 COLUMNS = ["date", "ticker", "open", "high", "low", "close", "volume", "adj_close"]
@@ -18,15 +26,18 @@ def _parse_date(x: date | str | None) -> date | None:
 
 
 def _months_in_range(start: date, end: date):
-    y, m = start.year, start.month
-    while date(y, m, 1) <= end:
-        yield y, m
-        m, y = (m + 1, y) if m < 12 else (1, y + 1)
+    months = pd.period_range(start, end, freq="M")
+    return zip(months.year.tolist(), months.month.tolist())
 
 
-def _read_csv(path: Path) -> pd.DataFrame | None:
+def _read_file(path: Path, columns: list[str] | None = None) -> pa.Table | None:
+    """Read one monthly file as an Arrow table; columns: read only these (None = all)."""
     try:
-        return pd.read_csv(path, parse_dates=["date"]) if path.is_file() else None
+        if not path.is_file():
+            return None
+        if path.suffix == ".parquet":
+            return pq.read_table(path, columns=columns)
+        return read_csv_table(path, columns)
     except Exception:
         return None
 
@@ -39,7 +50,7 @@ def load_prices(
     columns: list[str] | None = None,
 ) -> pd.DataFrame:
     """
-    Load price data from data/<year>/PRICES_<year>-M<month>.csv into one DataFrame.
+    Load price data from data/<year>/PRICES_<year>-M<month>.csv (or .parquet) into one DataFrame.
 
     tickers: include only these symbols; None = all.
     start_date / end_date: date or "YYYY-MM-DD"; None = no bound.
@@ -56,21 +67,41 @@ def load_prices(
     if start is not None or end is not None:
         start = start or date(1900, 1, 1)
         end = end or date(2100, 12, 31)
-        files = [root / str(y) / f"PRICES_{y}-M{m:02d}.csv" for y, m in _months_in_range(start, end)]
+        files = [
+            f
+            for y, m in _months_in_range(start, end)
+            for f in [
+                *(root / str(y) / f"PRICES_{y}-M{m:02d}{suffix}" for suffix in PRICE_SUFFIXES),
+                # Parquet append parts (PRICES_YYYY-M##.part-N.parquet), by part number
+                *part_paths(root / str(y) / f"PRICES_{y}-M{m:02d}.parquet"),
+            ]
+        ]
     else:
-        files = sorted(root.rglob("PRICES_*.csv"))
+        files = list_price_files(root)
 
-    parts = [df for f in files if (df := _read_csv(f)) is not None and not df.empty]
+    if not files:
+        return pd.DataFrame(columns=COLUMNS)
+    # File I/O and Arrow's parsers release the GIL, so reads overlap across threads
+    # Filters and the sort need date and ticker even when columns leaves them out
+    needed = list(dict.fromkeys(["date", "ticker", *columns])) if columns else None
+    with ThreadPoolExecutor(max_workers=min(32, os.cpu_count() or 1, len(files))) as ex:
+        parts = [t for t in ex.map(lambda f: _read_file(f, needed), files) if t is not None and t.num_rows]
     if not parts:
         return pd.DataFrame(columns=COLUMNS)
 
-    out = pd.concat(parts, ignore_index=True).drop_duplicates(subset=["date", "ticker"])
-    dt = pd.to_datetime(out["date"]).dt.date
+    # permissive: a month whose volume column came out as double promotes the rest
+    table = pa.concat_tables(parts, promote_options="permissive")
     lo, hi = start or date(1900, 1, 1), end or date(2100, 12, 31)
-    out = out[(dt >= lo) & (dt <= hi)]
+    mask = pc.and_(
+        pc.greater_equal(table["date"], pa.scalar(lo, pa.date32())),
+        pc.less_equal(table["date"], pa.scalar(hi, pa.date32())),
+    )
     if tickers:
-        out = out[out["ticker"].isin(tickers)]
-    out = out.sort_values(["date", "ticker"]).reset_index(drop=True)
+        mask = pc.and_(mask, pc.is_in(table["ticker"], value_set=pa.array(tickers, pa.string())))
+    # Stable sort, so the first file's row still comes first within a duplicate (date, ticker)
+    table = table.filter(mask).sort_by([("date", "ascending"), ("ticker", "ascending")])
+    out = table.to_pandas(date_as_object=False)
+    out = out.drop_duplicates(subset=["date", "ticker"], ignore_index=True)
     if columns:
         out = out[columns]
     return out